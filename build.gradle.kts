@@ -67,6 +67,11 @@ composeCompiler {
 tasks.test {
     useJUnitPlatform()
     jvmArgs("--enable-native-access=ALL-UNNAMED")
+    // One JVM per fork: each gets its own GLib main context and BackendRegistry,
+    // so test classes run in parallel without sharing process-wide singletons.
+    // Override with -Pimbric.testForks=N (ib bench pins it to 1 for stable timings).
+    maxParallelForks = providers.gradleProperty("imbric.testForks").orNull?.toIntOrNull()
+        ?: (Runtime.getRuntime().availableProcessors() / 2).coerceAtLeast(1)
     testLogging {
         events("passed", "skipped", "failed")
         showStandardStreams = true
@@ -11,7 +11,8 @@ def register(subparsers):
     p.add_argument("--all", action="store_true", help="Run all benchmarks")
 
 def run(args):
-    gradle_cmd = ["./gradlew", "test", "--console=plain"]
+    # Single fork so benchmarks don't compete with parallel test JVMs for CPU
+    gradle_cmd = ["./gradlew", "test", "--console=plain", "-Pimbric.testForks=1"]
     
     if args.tests:
         gradle_cmd.extend(["--tests", args.tests])
@@ -53,9 +53,8 @@ def _format_bytes(kb: int) -> str:
         return f"{kb / 1024:.0f}MB"
     return f"{kb}KB"
 
-def _format_process(proc: ProcessInfo, verbose: bool = False) -> str:
+def _format_process(proc: ProcessInfo, breakdown: dict, verbose: bool = False) -> str:
     """Format a process for display."""
-    breakdown = _get_memory_breakdown(proc.pid)
     rss = _format_bytes(breakdown["rss"])
     pss = _format_bytes(breakdown["pss"])
     shared = _format_bytes(breakdown["shared"])
@@ -85,8 +84,8 @@ def run(args):
         else:
             print(f"  {'PID':>6}  {'MEM':>6}  COMMAND")
         for p in procs:
-            print(_format_process(p, args.verbose))
             breakdown = _get_memory_breakdown(p.pid)
+            print(_format_process(p, breakdown, args.verbose))
             total_rss += breakdown["rss"]
             total_pss += breakdown["pss"]
             total_procs += 1
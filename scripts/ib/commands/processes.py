@@ -1,6 +1,5 @@
-import os
 import subprocess
-from ..process import ProcessManager, ProcessInfo
+from ..process import ProcessManager, ProcessInfo, CLK_TCK
 
 def register(subparsers):
     p = subparsers.add_parser("processes", help="Show all running Gradle/Kotlin/Imbric processes")
@@ -43,8 +42,7 @@ def _get_process_details(pid: int) -> dict:
             # Fields 13-14 are utime and stime in clock ticks
             utime = int(parts[13])
             stime = int(parts[14])
-            ticks_per_sec = os.sysconf(os.sysconf_names["SC_CLK_TCK"])
-            total_secs = (utime + stime) / ticks_per_sec
+            total_secs = (utime + stime) / CLK_TCK
             details["cpu_time"] = f"{total_secs:.1f}s"
     except (FileNotFoundError, ValueError, IndexError):
         pass
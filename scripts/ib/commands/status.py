@@ -1,7 +1,6 @@
-import os
 import time
 import subprocess
-from ..process import ProcessManager, ProcessInfo
+from ..process import ProcessManager, ProcessInfo, CLK_TCK
 from ..daemon import DaemonManager, PROJECT_ROOT, PID_FILE, LOG_FILE
 
 def register(subparsers):
@@ -18,10 +17,8 @@ def _get_uptime(pid: int) -> str:
             # Get system uptime
             with open("/proc/uptime") as f:
                 uptime_secs = float(f.read().split()[0])
-            # Get clock ticks per second
-            ticks_per_sec = os.sysconf(os.sysconf_names["SC_CLK_TCK"])
             # Calculate process start time relative to system boot
-            proc_start_secs = starttime / ticks_per_sec
+            proc_start_secs = starttime / CLK_TCK
             # Calculate uptime
             proc_uptime = uptime_secs - proc_start_secs
             if proc_uptime < 60:
@@ -20,6 +20,9 @@ _IMPORTANT = [
 # Use shared noise patterns from OutputFilter
 _GRADLE_NOISE = OutputFilter.NOISE_PATTERNS
 
+# Pass dots are flushed in batches; any other printed line flushes pending dots with it
+_DOT_FLUSH_EVERY = 20
+
 def register(subparsers):
     p = subparsers.add_parser("test", help="Run tests with clean, concise filtering")
     p.add_argument("--tests", type=str, help="Run specific test class or method (e.g. 'GioBackendTest')")
@@ -64,8 +67,8 @@ def run(args):
 
             # Passed test → single dot
             if _PASSED.search(line):
-                print(".", end="", flush=True)
                 dot_count += 1
+                print(".", end="", flush=dot_count % _DOT_FLUSH_EVERY == 0)
                 continue
 
             # Gradle noise → always suppress
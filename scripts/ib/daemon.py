@@ -13,6 +13,10 @@ GRADLE_DIR = PROJECT_ROOT / ".gradle"
 PID_FILE = GRADLE_DIR / "imbric-daemon.pid"
 LOG_FILE = GRADLE_DIR / "imbric-daemon.log"
 
+RUN_CMD = ("./gradlew", "run", "--console=plain")
+CONTINUOUS_CMD = ("./gradlew", "run", "--continuous", "--console=plain")
+HOT_CMD = ("./gradlew", "hotRun", "--auto", "--no-configuration-cache", "--console=plain")
+
 class DaemonManager:
     @staticmethod
     def read_pid() -> int | None:
@@ -99,10 +103,7 @@ class DaemonManager:
         signal.signal(signal.SIGTERM, handle_sigterm)
         signal.signal(signal.SIGINT, handle_sigterm)
 
-        if hot:
-            gradle_cmd = ["./gradlew", "hotRun", "--auto", "--no-configuration-cache", "--console=plain"]
-        else:
-            gradle_cmd = ["./gradlew", "run", "--continuous", "--console=plain"]
+        gradle_cmd = HOT_CMD if hot else CONTINUOUS_CMD
 
         cls._log("Daemon started.")
         cls._log(f"Project: {PROJECT_ROOT}")
@@ -11,6 +11,9 @@ KOTLIN_DAEMON_PATTERN = "KotlinCompileDaemon"
 GRADLE_DAEMON_PATTERN = "GradleDaemon"
 HOTRELOAD_DEVTOOLS_PATTERN = "compose.devtools"
 
+# Clock ticks per second, for converting /proc/<pid>/stat times; fixed for the life of the process
+CLK_TCK = os.sysconf(os.sysconf_names["SC_CLK_TCK"])
+
 @dataclass
 class ProcessInfo:
     pid: int
@@ -122,6 +122,9 @@ fun FileList(
     }
 }
 
+/** Minimum grid cell width; the grid fits as many columns of this width as possible. */
+private val GridCellMinWidth = 120.dp
+
 @Composable
 fun FileGrid(
     items: List<FileEntry>,
@@ -143,9 +146,10 @@ fun FileGrid(
     // Pre-calculate column count from available width for justified layout
     // This avoids GridCells.Adaptive's per-recomposition column width calculation
     val density = LocalDensity.current
+    val cellMinWidthPx = remember(density) { with(density) { GridCellMinWidth.roundToPx() } }
     BoxWithConstraints(modifier = modifier.fillMaxSize()) {
-        val columns = max(1, (maxWidth / 120.dp).toInt())
-        val cellWidth = maxWidth / columns
+        // Integer division on the pixel constraint — no Dp float math per measure pass
+        val columns = max(1, constraints.maxWidth / cellMinWidthPx)
 
         LazyVerticalGrid(
             columns = GridCells.Fixed(columns),
@@ -11,6 +11,7 @@ import androidx.compose.material3.*
 import androidx.compose.runtime.Composable
 import androidx.compose.runtime.collectAsState
 import androidx.compose.runtime.getValue
+import androidx.compose.runtime.remember
 import androidx.compose.ui.Alignment
 import androidx.compose.ui.Modifier
 import androidx.compose.ui.draw.clip
@@ -84,9 +85,10 @@ private fun TabItem(
     onClick: () -> Unit,
     onClose: () -> Unit
 ) {
-    // Collect the URI from the pane's view model to show the folder name
-    val state by pane.viewModel.state.collectAsState()
-    val folderName = IfsUri(state.uri).name.ifEmpty { "Root" }
+    // Collect only the URI, not the full browser state: listing and loading updates
+    // would otherwise recompose every tab label without changing its text
+    val uri by pane.viewModel.currentUri.collectAsState()
+    val folderName = remember(uri) { IfsUri(uri).name.ifEmpty { "Root" } }
 
     val backgroundColor = if (isSelected) {
         MaterialTheme.colorScheme.surfaceContainerHigh
@@ -35,7 +35,8 @@ data class FileBrowserState(
 class FileBrowserViewModel(
     private val registry: DirStateRegistry,
     initialUri: String,
-    private val viewModelScope: CoroutineScope
+    private val viewModelScope: CoroutineScope,
+    private val maxHistory: Int = MAX_HISTORY
 ) {
     private val _currentUri = MutableStateFlow(initialUri)
     val currentUri: StateFlow<String> = _currentUri.asStateFlow()
@@ -111,7 +112,7 @@ class FileBrowserViewModel(
         if (oldUri != uri) {
             pipelineTimer?.mark("vm_navigate_to", detail = uri)
             registry.getOrCreate(oldUri).stop()
-            _backStack.update { it + oldUri }
+            _backStack.update { (it + oldUri).takeLast(maxHistory) }
             _forwardStack.value = emptyList()
             
             if (!isParentOrSelf(uri, _virtualUri.value)) {
@@ -129,7 +130,7 @@ class FileBrowserViewModel(
             val targetUri = back.last()
             registry.getOrCreate(oldUri).stop()
             _backStack.value = back.dropLast(1)
-            _forwardStack.update { listOf(oldUri) + it }
+            _forwardStack.update { (listOf(oldUri) + it).take(maxHistory) }
             
             if (!isParentOrSelf(targetUri, _virtualUri.value)) {
                 _virtualUri.value = targetUri
@@ -146,7 +147,7 @@ class FileBrowserViewModel(
             val targetUri = forward.first()
             registry.getOrCreate(oldUri).stop()
             _forwardStack.value = forward.drop(1)
-            _backStack.update { it + oldUri }
+            _backStack.update { (it + oldUri).takeLast(maxHistory) }
             
             if (!isParentOrSelf(targetUri, _virtualUri.value)) {
                 _virtualUri.value = targetUri
@@ -180,6 +181,11 @@ class FileBrowserViewModel(
     fun enrichVisibleItems(visibleUris: List<String>) {
         dirStateFlow.value.enrichVisibleItems(visibleUris)
     }
+
+    companion object {
+        /** Back/forward entries kept per pane; the oldest are dropped past this. */
+        const val MAX_HISTORY = 256
+    }
 }
 
 private fun isParentOrSelf(parent: String, child: String): Boolean {
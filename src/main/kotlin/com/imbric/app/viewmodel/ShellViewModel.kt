@@ -50,8 +50,9 @@ class ShellViewModel(
         val currentTabs = _tabs.value
         if (currentTabs.size <= 1) return // Don't close the last tab
 
-        val tabToClose = currentTabs.find { it.id == id } ?: return
-        val index = currentTabs.indexOf(tabToClose)
+        val index = currentTabs.indexOfFirst { it.id == id }
+        if (index < 0) return
+        val tabToClose = currentTabs[index]
 
         // Determine the new active tab if we are closing the currently active one
         if (_activePaneId.value == id) {
@@ -62,6 +63,13 @@ class ShellViewModel(
         // Remove and destroy
         _tabs.update { it.filterNot { pane -> pane.id == id } }
         tabToClose.destroy()
+
+        // Stop the closed tab's directory monitor unless another tab still shows it.
+        // The listing stays cached in the registry for a fast re-open, as on navigation.
+        val closedUri = tabToClose.viewModel.currentUri.value
+        if (_tabs.value.none { it.viewModel.currentUri.value == closedUri } && registry.contains(closedUri)) {
+            registry.getOrCreate(closedUri).stop()
+        }
     }
 
     /**
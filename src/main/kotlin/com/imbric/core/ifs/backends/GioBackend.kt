@@ -100,17 +100,61 @@ class GioBackend(private val latencyProfiler: LatencyProfiler = PassiveLatencyPr
     /** Minimal attributes for directory listing — only what toListingFile() actually reads. */
     private val listingQueryAttributes = "standard::name,standard::type,standard::size,standard::content-type,time::modified"
 
+    /** Attributes read by listTrash() — built once rather than per call. */
+    private val trashQueryAttributes = "standard::name,standard::size,trash::orig-path,trash::deletion-date"
+
+    /** Attributes read by getThumbnailPath() and generateThumbnail(). */
+    private val thumbnailQueryAttributes = "thumbnail::path,standard::thumbnail-path"
+
+    /** The trash:/// root is immutable, so one GFile proxy serves every trash call. */
+    private val trashRoot: File by lazy { File.forUri("trash:///") }
+
+    /** Counter candidates probed with exists() before resolveUniqueTarget() lists the parent. */
+    private val uniqueNameDirectProbes = 2
+
+    /**
+     * Picks the first free "name (n)" sibling of [uri].
+     * The first few candidates are probed directly, since most conflicts end at "name (1)".
+     * Past those, the parent is listed once and the counter advances in memory; only the
+     * chosen candidate is confirmed with exists(), instead of one probe per counter step.
+     */
     private fun resolveUniqueTarget(uri: String): String {
+        if (!exists(uri)) return uri
+        val parent = uri.uriParent
         var current = uri
-        while (exists(current)) {
-            val parent = current.uriParent
-            val name = current.uriName
-            val newName = XferArbiter.generateNewName(name)
-            current = parent.uriJoin(newName)
+        repeat(uniqueNameDirectProbes) {
+            current = parent.uriJoin(XferArbiter.generateNewName(current.uriName))
+            if (!exists(current)) return current
         }
+        val taken = childNames(parent)
+        do {
+            var name = current.uriName
+            do {
+                name = XferArbiter.generateNewName(name)
+            } while (name in taken)
+            current = parent.uriJoin(name)
+        } while (exists(current))
         return current
     }
 
+    /** Names of [dirUri]'s children, or an empty set if it cannot be listed. */
+    private fun childNames(dirUri: String): Set<String> = try {
+        val names = HashSet<String>()
+        val enumerator = File.forUri(dirUri).enumerateChildren("standard::name", FileQueryInfoFlags.NONE, null)
+        try {
+            var childInfo = enumerator.nextFile(null)
+            while (childInfo != null) {
+                childInfo.name?.toString()?.let { names.add(it) }
+                childInfo = enumerator.nextFile(null)
+            }
+        } finally {
+            enumerator.close(null)
+        }
+        names
+    } catch (e: Exception) {
+        emptySet()
+    }
+
 
 override suspend fun list(uri: String, sortKey: SortKey): List<FileEntry> {
     val gfile = File.forUri(uri)
@@ -389,34 +433,52 @@ override suspend fun list(uri: String, sortKey: SortKey): List<FileEntry> {
         finalDestUri
     }
 
+    /**
+     * Reads the next batch of trash entries. Batched like list(): one FFM round-trip per
+     * 5000 entries instead of one nextFile() per entry. Like the async deletes that follow
+     * in emptyTrash(), this needs a running GLib main context.
+     */
+    private suspend fun org.gnome.gio.FileEnumerator.nextTrashBatch(): org.gnome.glib.List<org.gnome.gio.FileInfo> =
+        GioCoroutineBridge.awaitGioAsync(
+            block = { cancellable, callback ->
+                nextFilesAsync(5000, GLib.PRIORITY_DEFAULT, cancellable, callback)
+            },
+            finish = { result ->
+                nextFilesFinish(result)
+            }
+        )
+
     override suspend fun listTrash(): Result<List<TrashItem>> = withVfsErrorHandling("trash:///") {
         val items = mutableListOf<TrashItem>()
-        val trashRoot = File.forUri("trash:///")
         val enumerator = trashRoot.enumerateChildren(
-            "standard::name,standard::size,trash::orig-path,trash::deletion-date",
+            trashQueryAttributes,
             FileQueryInfoFlags.NONE,
             null
         )
         try {
-            var info = enumerator.nextFile(null)
-            while (info != null) {
-                val name = info.name?.toString() ?: ""
-                val size = info.size
-                
-                val origPathAttr = info.getAttributeByteString("trash::orig-path")
-                val origPath = origPathAttr ?: ""
-                
-                val dateStr = info.getAttributeAsString("trash::deletion-date") ?: ""
-                val deletionDate = try { kotlin.time.Instant.parse(dateStr).toEpochMilliseconds() } catch (e: Exception) { 0L }
-
-                items.add(TrashItem(
-                    name = name,
-                    originalPath = origPath,
-                    trashPath = "trash:///$name",
-                    deletionDate = deletionDate,
-                    size = size
-                ))
-                info = enumerator.nextFile(null)
+            while (true) {
+                val batch = enumerator.nextTrashBatch()
+                if (batch.isEmpty()) break
+
+                for (info in batch) {
+                    if (info == null) continue
+                    val name = info.name?.toString() ?: ""
+                    val size = info.size
+
+                    val origPathAttr = info.getAttributeByteString("trash::orig-path")
+                    val origPath = origPathAttr ?: ""
+
+                    val dateStr = info.getAttributeAsString("trash::deletion-date") ?: ""
+                    val deletionDate = try { kotlin.time.Instant.parse(dateStr).toEpochMilliseconds() } catch (e: Exception) { 0L }
+
+                    items.add(TrashItem(
+                        name = name,
+                        originalPath = origPath,
+                        trashPath = "trash:///$name",
+                        deletionDate = deletionDate,
+                        size = size
+                    ))
+                }
             }
         } finally {
             enumerator.close(null)
@@ -427,18 +489,19 @@ override suspend fun list(uri: String, sortKey: SortKey): List<FileEntry> {
     override suspend fun emptyTrash(): Result<Int> = withContext(Dispatchers.IO) {
         try {
             var deleted = 0
-            val trashRoot = File.forUri("trash:///")
             val enumerator = trashRoot.enumerateChildren("standard::name", FileQueryInfoFlags.NONE, null)
             val children = mutableListOf<File>()
             
             try {
-                var info = enumerator.nextFile(null)
-                while (info != null) {
-                    val name = info.name?.toString()
-                    if (!name.isNullOrEmpty()) {
-                        children.add(trashRoot.getChild(name))
+                while (true) {
+                    val batch = enumerator.nextTrashBatch()
+                    if (batch.isEmpty()) break
+                    for (info in batch) {
+                        val name = info?.name?.toString()
+                        if (!name.isNullOrEmpty()) {
+                            children.add(trashRoot.getChild(name))
+                        }
                     }
-                    info = enumerator.nextFile(null)
                 }
             } finally {
                 enumerator.close(null)
@@ -957,7 +1020,7 @@ override suspend fun list(uri: String, sortKey: SortKey): List<FileEntry> {
         try {
             val gfile = File.forUri(uri)
             val info = gfile.queryInfo(
-                "thumbnail::path,standard::thumbnail-path",
+                thumbnailQueryAttributes,
                 FileQueryInfoFlags.NONE,
                 null
             )
@@ -978,7 +1041,7 @@ override suspend fun list(uri: String, sortKey: SortKey): List<FileEntry> {
             val info = GioCoroutineBridge.awaitGioAsync(
                 block = { cancellable, callback ->
                     gfile.queryInfoAsync(
-                        "thumbnail::path,standard::thumbnail-path",
+                        thumbnailQueryAttributes,
                         FileQueryInfoFlags.NONE,
                         GLib.PRIORITY_LOW,
                         cancellable,
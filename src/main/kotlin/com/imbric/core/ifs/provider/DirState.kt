@@ -96,6 +96,8 @@ class DirState(
     private val isDestroyed = AtomicBoolean(false)
     /** True if [destroy] has been called. The registry uses this to detect stale entries. */
     val isDestroyedState: Boolean get() = isDestroyed.get()
+    /** True while the directory monitor is running, i.e. after a refresh/[onActive] and before [stop]. */
+    val isWatching: Boolean get() = watchJob?.isActive == true
 
     /** The current sort key. UI sets this, DirState adapts attribute fetching. */
     var sortKey: SortKey = SortKey.NAME
@@ -0,0 +1,43 @@
+package com.imbric.app.ui
+
+import androidx.compose.material.icons.Icons
+import androidx.compose.material.icons.filled.Description
+import androidx.compose.material.icons.filled.FilePresent
+import androidx.compose.material.icons.filled.Terminal
+import com.imbric.core.models.FileInfo
+import kotlin.test.Test
+import kotlin.test.assertEquals
+
+class DirectoryViewTest {
+
+    private fun file(name: String, mimeType: String, isExecutable: Boolean = false) = FileInfo(
+        path = "/tmp/$name", uri = "file:///tmp/$name", name = name,
+        isDirectory = false, mimeType = mimeType, isExecutable = isExecutable
+    )
+
+    @Test
+    fun testLaunchabilityIsResolvedPerFileForSameMimeType() {
+        val mime = "application/x-shellscript"
+        val plain = file("notes.sh", mime)
+        val executable = file("run.sh", mime, isExecutable = true)
+
+        // Resolve the non-executable one first so a MIME-only cache would pin its icon
+        assertEquals(Icons.Default.FilePresent, getIconForFile(plain))
+        assertEquals(Icons.Default.Terminal, getIconForFile(executable))
+        assertEquals(Icons.Default.FilePresent, getIconForFile(plain))
+    }
+
+    @Test
+    fun testEnrichedExecutableGetsLaunchableIcon() {
+        val listed = file("tool", "application/octet-stream")
+        assertEquals(Icons.Default.FilePresent, getIconForFile(listed))
+
+        // Enrichment later reports the execute bit for the same entry
+        assertEquals(Icons.Default.Terminal, getIconForFile(listed.copy(isExecutable = true)))
+    }
+
+    @Test
+    fun testMimeRulesTakePrecedenceOverLaunchability() {
+        assertEquals(Icons.Default.Description, getIconForFile(file("script.txt", "text/plain", isExecutable = true)))
+    }
+}
@@ -135,4 +135,22 @@ class FileBrowserViewModelTest {
         assertEquals(pathC, viewModel.currentUri.value)
         assertEquals(pathC, viewModel.virtualUri.value)
     }
+
+    @Test
+    fun `test back history is bounded and drops the oldest entries`() = runTest {
+        val registry = DirStateRegistry(backend, backgroundScope)
+        val uris = (0..4).map { "memory:///dir$it" }
+        uris.forEach { backend.createFolder("memory:///", it.substringAfterLast("/")) }
+
+        val viewModel = FileBrowserViewModel(registry, uris[0], backgroundScope, maxHistory = 2)
+        uris.drop(1).forEach { viewModel.navigateTo(it) }
+
+        viewModel.goBack()
+        viewModel.goBack()
+        assertEquals(uris[2], viewModel.currentUri.value)
+
+        // Older entries were dropped, so there is nothing further back
+        viewModel.goBack()
+        assertEquals(uris[2], viewModel.currentUri.value)
+    }
 }
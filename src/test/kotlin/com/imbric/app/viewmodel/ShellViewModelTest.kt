@@ -0,0 +1,73 @@
+package com.imbric.app.viewmodel
+
+import com.imbric.core.ifs.provider.DirStateRegistry
+import com.imbric.core.testing.InMemoryBackend
+import kotlinx.coroutines.Dispatchers
+import kotlinx.coroutines.ExperimentalCoroutinesApi
+import kotlinx.coroutines.flow.first
+import kotlinx.coroutines.test.*
+import org.junit.jupiter.api.AfterEach
+import org.junit.jupiter.api.BeforeEach
+import org.junit.jupiter.api.Test
+import kotlin.test.assertEquals
+import kotlin.test.assertFalse
+import kotlin.test.assertTrue
+import kotlin.uuid.ExperimentalUuidApi
+
+@OptIn(ExperimentalCoroutinesApi::class, ExperimentalUuidApi::class)
+class ShellViewModelTest {
+
+    private val testDispatcher = UnconfinedTestDispatcher()
+    private var backend = InMemoryBackend()
+
+    @BeforeEach
+    fun setup() {
+        Dispatchers.setMain(testDispatcher)
+        backend = InMemoryBackend()
+    }
+
+    @AfterEach
+    fun teardown() {
+        Dispatchers.resetMain()
+    }
+
+    @Test
+    fun `test closing the only tab on a URI stops its monitor but keeps it cached`() = runTest {
+        val registry = DirStateRegistry(backend, backgroundScope)
+        val homeUri = "memory:///home"
+        val docsUri = "memory:///docs"
+        backend.createFolder("memory:///", "home")
+        backend.createFolder("memory:///", "docs")
+
+        val shell = ShellViewModel(registry, backgroundScope, initialUri = homeUri)
+        shell.addTab(docsUri)
+        val docs = registry.getOrCreate(docsUri)
+        docs.isLoading.first { !it }
+        assertTrue(docs.isWatching)
+
+        shell.closeTab(shell.tabs.value.last().id)
+
+        assertEquals(1, shell.tabs.value.size)
+        assertFalse(docs.isWatching, "Closed tab's directory monitor should be stopped")
+        assertTrue(registry.contains(docsUri), "Listing should stay cached for a fast re-open")
+        assertTrue(registry.getOrCreate(homeUri).isWatching, "Remaining tab's monitor should keep running")
+    }
+
+    @Test
+    fun `test closing one of two tabs on the same URI keeps the monitor running`() = runTest {
+        val registry = DirStateRegistry(backend, backgroundScope)
+        val homeUri = "memory:///home"
+        backend.createFolder("memory:///", "home")
+
+        val shell = ShellViewModel(registry, backgroundScope, initialUri = homeUri)
+        shell.addTab(homeUri)
+        val home = registry.getOrCreate(homeUri)
+        home.isLoading.first { !it }
+        assertTrue(home.isWatching)
+
+        shell.closeTab(shell.tabs.value.last().id)
+
+        assertEquals(1, shell.tabs.value.size)
+        assertTrue(home.isWatching, "Another tab still shows this URI")
+    }
+}
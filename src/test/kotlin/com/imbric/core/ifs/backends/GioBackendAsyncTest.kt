@@ -84,7 +84,7 @@ class GioBackendAsyncTest {
     @Test
     fun testCopyWithProgress(@TempDir tempDir: Path) = runTest {
         withGlibPump {
-            BashHelper.runScript("dd if=/dev/zero of=src_large.txt bs=1024 count=100", tempDir.toFile())
+            BashHelper.runScript("dd if=/dev/zero of=src_large.txt bs=100K count=1", tempDir.toFile())
             val srcUri = "file://${tempDir.toAbsolutePath()}/src_large.txt"
             val destUri = "file://${tempDir.toAbsolutePath()}/dest_large.txt"
 
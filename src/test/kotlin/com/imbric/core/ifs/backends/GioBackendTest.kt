@@ -191,4 +191,91 @@ class GioBackendTest {
             assertEquals("file://${src.toAbsolutePath()}", exception.uri)
         }
     }
+
+    @Test
+    fun testAutoRenameSkipsExistingCounterNames(@TempDir tempDir: Path) = runTest {
+        withGlibPump {
+            BashHelper.runScript("""
+                mkdir dest
+                echo -n "new" > a.txt
+                touch "dest/a.txt" "dest/a (1).txt" "dest/a (2).txt"
+            """.trimIndent(), tempDir.toFile())
+
+            val dest = tempDir.resolve("dest")
+            val job = FileJob(
+                id = Uuid.random(),
+                opType = "copy",
+                source = "file://${tempDir.resolve("a.txt").toAbsolutePath()}",
+                dest = "file://${dest.resolve("a.txt").toAbsolutePath()}",
+                autoRename = true
+            )
+
+            backend.copy(job).toList()
+
+            assertEquals("new", dest.resolve("a (3).txt").toFile().readText())
+            assertEquals("", dest.resolve("a.txt").toFile().readText(), "Existing file must not be overwritten")
+        }
+    }
+
+    @Test
+    fun testAutoRenameFallsBackToProbingWhenParentCannotBeListed(@TempDir tempDir: Path) = runTest {
+        withGlibPump {
+            // Write+search but no read permission: children can be stat'ed but not enumerated.
+            // (Root ignores the mode, in which case the listing path runs instead.)
+            BashHelper.runScript("""
+                mkdir dest
+                echo -n "new" > a.txt
+                touch "dest/a.txt" "dest/a (1).txt" "dest/a (2).txt"
+                chmod 300 dest
+            """.trimIndent(), tempDir.toFile())
+
+            val dest = tempDir.resolve("dest")
+            try {
+                val job = FileJob(
+                    id = Uuid.random(),
+                    opType = "copy",
+                    source = "file://${tempDir.resolve("a.txt").toAbsolutePath()}",
+                    dest = "file://${dest.resolve("a.txt").toAbsolutePath()}",
+                    autoRename = true
+                )
+
+                backend.copy(job).toList()
+
+                assertTrue(dest.resolve("a (3).txt").toFile().exists())
+            } finally {
+                BashHelper.runScript("chmod 700 dest", tempDir.toFile())
+            }
+            assertEquals("new", dest.resolve("a (3).txt").toFile().readText())
+        }
+    }
+
+    @Test
+    fun testListTrashReturnsEveryTrashedEntry(@TempDir tempDir: Path) = runTest {
+        withGlibPump {
+            val names = (1..3).map { "trash_${Uuid.random()}.txt" }
+            BashHelper.runScript(names.joinToString("\n") { "echo -n x > $it" }, tempDir.toFile())
+
+            val trashed = names.map { name ->
+                val job = FileJob(
+                    id = Uuid.random(),
+                    opType = "trash",
+                    source = "file://${tempDir.resolve(name).toAbsolutePath()}",
+                    dest = ""
+                )
+                backend.trash(job, recoverTrashUri = false)
+            }
+            org.junit.jupiter.api.Assumptions.assumeTrue(trashed.all { it.isSuccess }, "No trash available for the temp directory")
+
+            val items = backend.listTrash().getOrThrow()
+            val ours = items.filter { item -> names.any { item.originalPath.endsWith("/$it") } }
+            try {
+                assertEquals(names.toSet(), ours.map { it.originalPath.substringAfterLast('/') }.toSet())
+                ours.forEach { assertEquals(1L, it.size) }
+            } finally {
+                ours.forEach { item ->
+                    backend.delete(FileJob(id = Uuid.random(), opType = "delete", source = item.trashPath, dest = ""))
+                }
+            }
+        }
+    }
 }
@@ -529,9 +529,8 @@ class DirStateTest {
         val testDispatcher = UnconfinedTestDispatcher(testScheduler)
         val dirState = DirState("memory://parent", backend, backgroundScope, testDispatcher)
         advanceUntilIdle()
-        // Allow enrichment coroutines (launched on DirState.scope) to complete
-        delay(1000)
-        advanceUntilIdle()
+        // Wait on the enrichment itself rather than a fixed 1s delay
+        dirState.whenEnriched("memory://parent/child").first()
 
         // items are children of the listed directory, not the directory itself
         val childDir = dirState.items.value.find { it.name == "child" }!! as com.imbric.core.models.FileInfo
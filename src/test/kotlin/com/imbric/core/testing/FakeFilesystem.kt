@@ -128,14 +128,18 @@ class FakeFilesystem {
         fun assertHasError() { assertTrue(error != null) }
         fun assertNoError() { assertEquals(null, error) }
 
-        /** Wait for items to satisfy a predicate. Uses real delays. */
+        /**
+         * Wait for items to satisfy a predicate.
+         * Suspends on the items StateFlow, so it wakes on the emission that satisfies
+         * the predicate instead of polling on a fixed interval.
+         */
         fun waitUntil(timeoutMs: Long = 2000, predicate: (List<FileEntry>) -> Boolean) {
-            val deadline = System.currentTimeMillis() + timeoutMs
-            while (System.currentTimeMillis() < deadline) {
-                if (predicate(items)) return
-                runBlocking { delay(50) }
+            val matched = runBlocking {
+                withTimeoutOrNull(timeoutMs) { dirState.items.first(predicate) }
+            }
+            if (matched == null) {
+                throw AssertionError("Timed out. Current: ${items.map { it.name }}")
             }
-            throw AssertionError("Timed out. Current: ${items.map { it.name }}")
         }
     }
 }
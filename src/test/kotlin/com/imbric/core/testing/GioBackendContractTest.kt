@@ -11,10 +11,11 @@ class GioBackendContractTest : IOBackendContractTest() {
     override fun getTestRootUri(): String = "file://$testDir"
 
     override fun setupTestEnvironment() {
-        BashHelper.runScript("mkdir -p $testDir")
+        // Plain mkdirs — no need to fork a bash process just to create the root
+        java.io.File(testDir).mkdirs()
     }
 
     override fun teardownTestEnvironment() {
-        BashHelper.runScript("rm -rf $testDir")
+        java.io.File(testDir).deleteRecursively()
     }
 }
\ No newline at end of file
@@ -15,8 +15,6 @@ class MonitoringContractTest : ContractTestBase() {
 
         fs.createFile("memory://watched/new.txt")
         simulateCreated("memory://watched/new.txt")
-        waitForEvents()
-
         view.waitUntil { it.size == 2 }
         view.assertShowsExactly("existing.txt", "new.txt")
     }
@@ -30,8 +28,6 @@ class MonitoringContractTest : ContractTestBase() {
 
         fs.deleteFile("memory://watched/remove.txt")
         simulateDeleted("memory://watched/remove.txt")
-        waitForEvents()
-
         view.waitUntil { it.size == 1 }
         view.assertShowsExactly("keep.txt")
     }
@@ -45,8 +41,6 @@ class MonitoringContractTest : ContractTestBase() {
         fs.deleteFile("memory://watched/old_name.txt")
         fs.createFile("memory://watched/new_name.txt")
         simulateRenamed("memory://watched/old_name.txt", "memory://watched/new_name.txt")
-        waitForEvents()
-
         view.waitUntil { items -> items.any { it.name == "new_name.txt" } }
         view.assertNotContains("old_name.txt")
         view.assertContains("new_name.txt")
@@ -64,9 +58,8 @@ class MonitoringContractTest : ContractTestBase() {
         simulateCreated("memory://watched/b.txt")
         simulateCreated("memory://watched/c.txt")
         simulateDeleted("memory://watched/a.txt")
-        waitForEvents()
-
-        view.waitUntil { it.size == 2 }
+        // Wait for the final state, not just the size — {a, b} is a valid intermediate
+        view.waitUntil { items -> items.map { it.name }.sorted() == listOf("b.txt", "c.txt") }
         view.assertShowsExactly("b.txt", "c.txt")
     }
 
@@ -104,8 +97,6 @@ class MonitoringContractTest : ContractTestBase() {
         fs.deleteFile("memory://watched/moving.txt")
         fs.createFile("memory://other/moved.txt")
         simulateRenamed("memory://watched/moving.txt", "memory://other/moved.txt")
-        waitForEvents()
-
         view.waitUntil { it.isEmpty() }
         view.assertEmpty()
     }
@@ -52,15 +52,14 @@ class HardeningIntegrationTest {
             }
         )
 
-        val results = mutableListOf<TransactionEvent>()
         backend.injectExistsError = true 
         
-        flow.collect { results.add(it) }
+        val finalEvent = flow.last()
         
         assertTrue(backend.injectExistsErrorWasTriggered, "JIT Conflict should have been triggered")
         assertTrue(conflictCalled, "Manual conflict resolver should have been called")
         assertTrue(backend.exists(destFile), "File should have been copied eventually")
-        val finalStatus = (results.last() as TransactionEvent.Finished).status
+        val finalStatus = (finalEvent as TransactionEvent.Finished).status
         assertEquals(TransactionStatus.COMPLETED, finalStatus)
     }
 
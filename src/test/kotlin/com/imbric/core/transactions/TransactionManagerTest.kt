@@ -6,9 +6,12 @@ import com.imbric.core.logic.XferArbiter
 import com.imbric.core.testing.InMemoryBackend
 import com.imbric.core.transactions.models.TransactionStatus
 import kotlinx.coroutines.test.runTest
-import kotlinx.coroutines.delay
+import kotlinx.coroutines.CompletableDeferred
+import kotlinx.coroutines.Dispatchers
 import kotlinx.coroutines.Job
 import kotlinx.coroutines.launch
+import kotlinx.coroutines.withContext
+import kotlinx.coroutines.withTimeoutOrNull
 import kotlin.test.BeforeTest
 import kotlin.test.Test
 import kotlin.test.assertEquals
@@ -28,6 +31,13 @@ class TransactionManagerTest {
         tm = TransactionManager(BackendRegistry, XferArbiter, dispatcher)
     }
 
+    /**
+     * Suspends until the transaction reports completion, or returns null after 2s.
+     * tm runs on Dispatchers.Default, so the timeout must be real time, not the test scheduler's.
+     */
+    private suspend fun awaitFinished(finished: CompletableDeferred<TransactionStatus>): TransactionStatus? =
+        withContext(Dispatchers.Default) { withTimeoutOrNull(2000) { finished.await() } }
+
     @Test
     fun testBatchTransfer_AllSucceed() = runTest {
         // Setup files
@@ -37,8 +47,8 @@ class TransactionManagerTest {
         backend.createFile("memory://src", "file2.txt")
         backend.createFile("memory://src", "file3.txt")
 
-        var finishedStatus: TransactionStatus? = null
-        tm.onTransactionFinished = { _, status -> finishedStatus = status }
+        val finished = CompletableDeferred<TransactionStatus>()
+        tm.onTransactionFinished = { _, status -> finished.complete(status) }
         
         val tid = tm.startTransaction("Batch transfer")
         tm.addOperation(tid, "copy", "memory://src/file1.txt", "memory://dest/file1.txt")
@@ -46,11 +56,7 @@ class TransactionManagerTest {
         tm.addOperation(tid, "copy", "memory://src/file3.txt", "memory://dest/file3.txt")
         tm.commitTransaction(tid)
         
-        // Wait for coroutines to finish
-        val endTime = System.currentTimeMillis() + 2000
-        while (finishedStatus == null && System.currentTimeMillis() < endTime) {
-            delay(10)
-        }
+        val finishedStatus = awaitFinished(finished)
 
         assertEquals(TransactionStatus.COMPLETED, finishedStatus)
         assertTrue(backend.exists("memory://dest/file1.txt"))
@@ -71,15 +77,12 @@ class TransactionManagerTest {
             "memory://src/file2.txt" // Does not exist
         )
 
-        var finishedStatus: TransactionStatus? = null
-        tm.onTransactionFinished = { _, status -> finishedStatus = status }
+        val finished = CompletableDeferred<TransactionStatus>()
+        tm.onTransactionFinished = { _, status -> finished.complete(status) }
 
         val tid = tm.batchTransfer(sources, "memory://dest")
         
-        val endTime = System.currentTimeMillis() + 2000
-        while (finishedStatus == null && System.currentTimeMillis() < endTime) {
-            delay(10)
-        }
+        val finishedStatus = awaitFinished(finished)
 
         assertEquals(TransactionStatus.PARTIAL, finishedStatus)
         assertTrue(backend.exists("memory://dest/file1.txt")) // Succeeded
@@ -96,15 +99,12 @@ class TransactionManagerTest {
 
         var lastProgress = 0f
         tm.onTransactionProgress = { _, pct -> lastProgress = pct }
-        var finishedStatus: TransactionStatus? = null
-        tm.onTransactionFinished = { _, status -> finishedStatus = status }
+        val finished = CompletableDeferred<TransactionStatus>()
+        tm.onTransactionFinished = { _, status -> finished.complete(status) }
 
         tm.batchTransfer(sources, "memory://dest")
         
-        val endTime = System.currentTimeMillis() + 2000
-        while (finishedStatus == null && System.currentTimeMillis() < endTime) {
-            delay(10)
-        }
+        val finishedStatus = awaitFinished(finished)
         
         assertTrue(lastProgress > 0f)
         assertEquals(TransactionStatus.COMPLETED, finishedStatus)